@@ -4,13 +4,22 @@
 Including port binding, workers,logging, and request handling parameters.
 """
 
+import os
 from multiprocessing import cpu_count
 
 bind = "0.0.0.0:8000"
+backlog = int(os.getenv("BACKLOG", "2048"))
 
 # Worker Options
-workers = cpu_count() * 2 + 1
-worker_class = "uvicorn.workers.UvicornWorker"
+# The app is async and I/O-bound, so one worker per core is enough; scale out with more
+# instances rather than more forks per host
+workers = int(os.getenv("WEB_CONCURRENCY", cpu_count()))
+# Picks uvloop and httptools automatically when installed (uvicorn[standard]) and caps
+# in-flight requests per worker with LIMIT_CONCURRENCY
+worker_class = "src.core.worker.LimitedUvicornWorker"
+# Import the app once in the master so model clients and graphs are shared copy-on-write
+# by all workers instead of being rebuilt in each one
+preload_app = True
 
 # Logging Options
 loglevel = "info"
@@ -19,4 +28,7 @@
 
 max_requests = 1000
 max_requests_jitter = 100
-timeout = 3600
+timeout = 300
+
+# Keep idle client connections open between requests (uvicorn's timeout_keep_alive)
+keepalive = 75
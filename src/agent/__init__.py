@@ -6,37 +6,106 @@
 configuration and efficient resource usage.
 """
 
+import hashlib
+import json
+import logging
+
+import httpx
+import tiktoken
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
+from langchain_core.messages import BaseMessage
 from langchain_openai import ChatOpenAI
-from openai import OpenAI
+from openai import AsyncOpenAI
 from src.core.config import settings
 
+# Shared connection pool so every async OpenAI call reuses warm TCP/TLS connections.
+# No socket is opened until the first request, so building it before gunicorn forks
+# (preload_app) is safe; each worker warms its own copy in the app lifespan. It lives as
+# long as the process and is never closed by the app.
+http_client = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_connections=256, max_keepalive_connections=64, keepalive_expiry=60),
+)
+
 class LLM(ChatOpenAI):
-    def __init__(self, **kwargs):
+    def __init__(self, model=settings.chat_completion_model, **kwargs):
         super().__init__(
-            model=settings.chat_completion_model,
+            model=model,
             openai_api_key=settings.openai_api_key,
             base_url=settings.openai_base_url,
-            streaming=True
+            streaming=True,
+            max_retries=settings.openai_max_retries,
+            http_async_client=http_client,
         )
 
 class whisper():
     def __init__(self, **kwargs):
-        self.client = OpenAI(
+        self.aclient = AsyncOpenAI(
             api_key = settings.openai_api_key,
-            base_url = settings.openai_base_url
+            base_url = settings.openai_base_url,
+            max_retries = settings.openai_max_retries,
+            http_client = http_client
+        )
+
+    async def atranscribe(self, filename, data):
+        await throttle()
+        transcription = await self.aclient.audio.transcriptions.create(
+            model=settings.whisper_model,
+            file=(filename, data),
+            response_format="text",
+            language="en"
         )
-        
-    def transcribe(self, filepath):
-        with open(filepath, "rb") as audio_file:
-            transcription = self.client.audio.transcriptions.create(
-                model=settings.whisper_model,
-                file=audio_file,
-                response_format="text",
-                language="en"
-            )
         return transcription
 
+# Characters per token, used wherever tokens are estimated instead of counted
+CHARS_PER_TOKEN = 4
+
+# Filled in by load_tokenizer(), which the app lifespan runs in the background of each
+# worker. Until it finishes, or if tiktoken cannot fetch its BPE file (offline or intranet
+# deployments), callers get None and estimate with CHARS_PER_TOKEN, so no request ever
+# waits on the download or on the lock tiktoken holds while downloading
+tokenizers: dict[str, tiktoken.Encoding] = {}
+
+def load_tokenizer() -> None:
+    try:
+        encoding_name = tiktoken.encoding_name_for_model(settings.chat_completion_model)
+    except KeyError:
+        encoding_name = "o200k_base"
+    try:
+        tokenizers["encoding"] = tiktoken.get_encoding(encoding_name)
+    except Exception as e:
+        logging.warning(f"Tokenizer unavailable, estimating token counts instead: {str(e)}")
+
+def get_tokenizer() -> tiktoken.Encoding | None:
+    return tokenizers.get("encoding")
+
+# Per-worker budgets keeping OpenAI calls under the account rate limits. Prompt tokens are
+# estimated so the limiter never tokenizes on the event loop or depends on tiktoken
+rate_limiters = {
+    "requests": AsyncLimiter(settings.openai_requests_per_minute, 60),
+    "tokens": AsyncLimiter(settings.openai_tokens_per_minute, 60),
+}
+
+async def throttle(messages: list[BaseMessage] | None = None) -> None:
+    await rate_limiters["requests"].acquire()
+    if messages:
+        tokens = sum(len(str(message.content)) for message in messages) // CHARS_PER_TOKEN
+        await rate_limiters["tokens"].acquire(min(tokens, settings.openai_tokens_per_minute))
+
 llms = {
     "chat_completion": LLM(),
+    "summary_map": LLM(model=settings.summary_map_model),
+    "summary_reduce": LLM(model=settings.summary_reduce_model),
     "whisper": whisper()
 }
+
+# In-process response caches: chat replies keyed by prompt, summaries keyed by audio digest
+caches = {
+    "chat": TTLCache(maxsize=settings.response_cache_size, ttl=settings.response_cache_ttl),
+    "summary": TTLCache(maxsize=settings.response_cache_size, ttl=settings.response_cache_ttl),
+}
+
+def cache_key(messages: list[BaseMessage]) -> str:
+    payload = json.dumps([[message.type, message.content] for message in messages])
+    return hashlib.sha256(payload.encode()).hexdigest()
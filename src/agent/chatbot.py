@@ -7,14 +7,17 @@
 - Handles streaming responses from the chat model
 """
 
+from collections.abc import AsyncIterator
 from typing import Annotated
 
 from langchain_core.messages import HumanMessage
+from langchain_openai import ChatOpenAI
 from langgraph.graph import StateGraph
 from langgraph.graph.message import add_messages
+from langgraph.graph.state import CompiledStateGraph
 from pydantic import BaseModel
 
-from src.agent import llms
+from src.agent import cache_key, caches, llms, throttle
 
 
 # Define state with message history
@@ -30,6 +33,40 @@ class State(BaseModel):
     messages: Annotated[list, add_messages]
 
 
+def _build_graph(llm: ChatOpenAI) -> CompiledStateGraph:
+    """
+    Build the chatbot graph workflow around the given language model.
+
+    Args:
+        llm (ChatOpenAI): The language model invoked by the chatbot node.
+
+    Returns:
+        CompiledStateGraph: The compiled graph workflow for message processing.
+
+    """
+
+    async def chatbot(state: State) -> dict:
+        key = cache_key(state.messages)
+        if (cached := caches["chat"].get(key)) is not None:
+            return {"messages": cached}
+
+        await throttle(state.messages)
+        response = await llm.ainvoke(state.messages)
+        caches["chat"][key] = response
+        return {"messages": response}
+
+    # Create graph workflow
+    graph_builder = StateGraph(State)
+    graph_builder.add_node("chatbot", chatbot)
+    graph_builder.set_entry_point("chatbot")
+    graph_builder.set_finish_point("chatbot")
+    return graph_builder.compile()
+
+
+# Compiled once at import and shared by every ChatbotAgent instance
+_GRAPH = _build_graph(llms["chat_completion"])
+
+
 class ChatbotAgent:
     """
     A chatbot agent class that handles conversational interactions using LangChain and OpenAI.
@@ -51,28 +88,19 @@ def __init__(self) -> None:
 
         """
         self.llm = llms["chat_completion"]
-
-        async def chatbot(state: State) -> dict:
-            response = await self.llm.ainvoke(state.messages)
-            return {"messages": response}
-
-        # Create graph workflow
-        graph_builder = StateGraph(State)
-        graph_builder.add_node("chatbot", chatbot)
-        graph_builder.set_entry_point("chatbot")
-        graph_builder.set_finish_point("chatbot")
-        self.graph = graph_builder.compile()
+        self.graph = _GRAPH
 
     async def stream_chatbot(
         self,
         query: Annotated[dict[str, str], "The message"],
         config: Annotated[dict[str, dict], "Configuration parameters"],
-    ) -> str:
+    ) -> AsyncIterator[dict[str, str]]:
         """
         Stream chat responses from the chatbot asynchronously.
 
         Returns:
-            str: Yields chunks of the chatbot's response as a stream.
+            AsyncIterator[dict[str, str]]: Yields server-sent events carrying chunks
+            of the chatbot's response.
 
         Raises:
             Exception: If any error occurs during the streaming process.
@@ -85,6 +113,6 @@ async def stream_chatbot(
                 input={"messages": [human_message]}, config=config, stream_mode="messages"
             ):
                 message, meta = chunk
-                yield f"data: {message.content}\n\n"
+                yield {"data": message.content}
         except Exception as e:
-            yield f"data: {str(e)}\n\n"
+            yield {"data": str(e)}
@@ -7,15 +7,91 @@
 - Handle the workflow of audio processing through a graph-based pipeline
 """
 
-from typing import Annotated, Any
+import asyncio
+from functools import lru_cache
+from typing import IO, Annotated, Any
 
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_openai import ChatOpenAI
 from langgraph.graph import Graph, StateGraph
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
-from src.agent import llms
+from src.agent import CHARS_PER_TOKEN, get_tokenizer, llms, throttle
 from src.api.schemas import MinuteWriterOutput
 
+# Validator for the final pipeline state, built once instead of per summary
+_OUTPUT_ADAPTER = TypeAdapter(MinuteWriterOutput)
+
+# Maximum number of tokens per transcript chunk in the map step of summarization
+SUMMARY_CHUNK_TOKENS = 3000
+
+_SYSTEM_MESSAGE = ("system", "You are a helpful assistant that creates concise meeting summaries.")
+_SUMMARY_SECTIONS = """Format the summary with these sections:
+- Meeting Overview
+- Key Points
+- Action Items
+- Next Steps"""
+
+# Prompts are parsed once at import; each call only substitutes the transcript text
+_SUMMARY_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        _SYSTEM_MESSAGE,
+        (
+            "human",
+            "Please summarize this meeting transcript and format it in markdown:\n\n"
+            "{transcript}\n\n" + _SUMMARY_SECTIONS,
+        ),
+    ]
+)
+_PART_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        _SYSTEM_MESSAGE,
+        (
+            "human",
+            "Summarize this part of a meeting transcript. Keep every key point, decision and "
+            "action item:\n\n{transcript}",
+        ),
+    ]
+)
+_COMBINE_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        _SYSTEM_MESSAGE,
+        (
+            "human",
+            "Please combine these partial summaries of a meeting transcript into one summary "
+            "and format it in markdown:\n\n{summaries}\n\n" + _SUMMARY_SECTIONS,
+        ),
+    ]
+)
+
+
+def _split_transcript(text: str, max_tokens: int = SUMMARY_CHUNK_TOKENS) -> list[str]:
+    """
+    Split a transcript into consecutive chunks of at most ``max_tokens`` tokens.
+
+    Falls back to chunks of ``max_tokens * CHARS_PER_TOKEN`` characters while the tokenizer
+    is not loaded.
+
+    Args:
+        text: Transcript to split
+        max_tokens: Maximum number of tokens per chunk
+
+    Returns:
+        List of transcript chunks in their original order
+
+    """
+    tokenizer = get_tokenizer()
+    if tokenizer is None:
+        size = max_tokens * CHARS_PER_TOKEN
+        return [text[start : start + size] for start in range(0, len(text), size)]
+
+    tokens = tokenizer.encode(text)
+    return [
+        tokenizer.decode(tokens[start : start + max_tokens])
+        for start in range(0, len(tokens), max_tokens)
+    ]
+
 
 class MinuteWriter:
     """
@@ -42,38 +118,49 @@ def __init__(self) -> None:
         """
         try:
             self.whisper = llms["whisper"]
-            self.summarizer = llms["chat_completion"]
+            self.chunk_summarizer = llms["summary_map"]
+            self.summarizer = llms["summary_reduce"]
         except Exception as e:
             raise RuntimeError(f"Failed to initialize MinuteWriter: {str(e)}") from e
 
-    def transcribe(
+    async def transcribe(
         self,
-        state: Annotated[dict[str, Any], "Current state dictionary containing audio file path"],
+        state: Annotated[dict[str, Any], "Current state dictionary containing audio file data"],
     ) -> dict[str, Any]:
         """
         Transcribe audio file to text using OpenAI's Whisper model.
 
         Args:
-            state: Dictionary containing audio file path and other state information
+            state: Dictionary containing audio file name, audio data and other state information
 
         Returns:
             Updated state dictionary with transcript
 
         Raises:
             ValueError: If transcription fails
-            FileNotFoundError: If audio file is not found
 
         """
         try:
-            state["transcript"] = self.whisper.transcribe(state["audio_path"])
+            state["transcript"] = await self.whisper.atranscribe(
+                state["audio_filename"], state["audio_data"]
+            )
             return state
         except Exception as e:
             raise ValueError(f"Failed to transcribe audio: {str(e)}") from e
 
-    def summarize(self, state: dict[str, Any]) -> dict[str, Any]:
+    @staticmethod
+    async def _ainvoke(llm: ChatOpenAI, messages: list[BaseMessage]) -> AIMessage:
+        """Invoke a summarization model once the OpenAI rate limit budget allows it."""
+        await throttle(messages)
+        return await llm.ainvoke(messages)
+
+    async def summarize(self, state: dict[str, Any]) -> dict[str, Any]:
         """
         Generate structured meeting summary from transcript using GPT-4.
 
+        Long transcripts are split into chunks that are summarized concurrently,
+        and the partial summaries are then combined into the final summary.
+
         Args:
             state: Dictionary containing transcript and other state information
 
@@ -89,33 +176,32 @@ def summarize(self, state: dict[str, Any]) -> dict[str, Any]:
             if not transcript:
                 raise ValueError("Missing or empty transcript in state")
 
-            prompt = f"""Please summarize this meeting transcript and format it in markdown:
-
-            {transcript}
-
-            Format the summary with these sections:
-            - Meeting Overview
-            - Key Points
-            - Action Items
-            - Next Steps
-            """
-
-            ai_message = self.summarizer.invoke(
-                input=[
-                    SystemMessage(
-                        content="""You are a helpful assistant that creates concise
-                                   meeting summaries."""
-                    ),
-                    HumanMessage(content=prompt),
-                ],
-            )
+            # Tokenizing a long transcript is CPU-bound, so keep it off the event loop
+            chunks = await asyncio.to_thread(_split_transcript, transcript)
+            if len(chunks) > 1:
+                partials = await asyncio.gather(
+                    *[
+                        self._ainvoke(
+                            self.chunk_summarizer, _PART_PROMPT.format_messages(transcript=chunk)
+                        )
+                        for chunk in chunks
+                    ]
+                )
+                messages = _COMBINE_PROMPT.format_messages(
+                    summaries="\n\n".join(partial.content for partial in partials)
+                )
+            else:
+                messages = _SUMMARY_PROMPT.format_messages(transcript=transcript)
+
+            ai_message = await self._ainvoke(self.summarizer, messages)
             state["summary"] = ai_message.content
-            MinuteWriterOutput(**state)  # Validate output state
+            _OUTPUT_ADAPTER.validate_python(state)  # Validate output state
             return state
         except (ValidationError, KeyError, Exception) as e:
             raise ValueError(f"Failed to summarize transcript: {str(e)}") from None
 
 
+@lru_cache(maxsize=1)
 def create_minute_writer_graph() -> Graph:
     """
     Create and configure a workflow graph for the MinuteWriter pipeline.
@@ -128,12 +214,15 @@ def create_minute_writer_graph() -> Graph:
     - transcribe: Handles audio transcription
     - summarize: Generates meeting summary from transcript
 
+    The graph is built once and cached, so repeated calls return the same instance.
+
     """
     workflow = StateGraph(state_schema=dict)  # Add state schema
+    writer = MinuteWriter()
 
     # Add nodes
-    workflow.add_node("transcribe", MinuteWriter().transcribe)
-    workflow.add_node("summarize", MinuteWriter().summarize)
+    workflow.add_node("transcribe", writer.transcribe)
+    workflow.add_node("summarize", writer.summarize)
 
     # Create edges
     workflow.add_edge("transcribe", "summarize")
@@ -146,12 +235,13 @@ def create_minute_writer_graph() -> Graph:
     return graph
 
 
-def process_meeting_recording(audio_file_path: str) -> str:
+async def process_meeting_recording(audio_filename: str, audio_data: bytes | IO[bytes]) -> str:
     """
     Process a meeting recording by transcribing and summarizing it.
 
     Args:
-        audio_file_path (str): Path to the audio file to be processed
+        audio_filename (str): Original name of the uploaded audio file
+        audio_data (bytes | IO[bytes]): Raw content or binary stream of the audio file
 
     Returns:
         str: The generated meeting summary in markdown format
@@ -162,8 +252,8 @@ def process_meeting_recording(audio_file_path: str) -> str:
     """
     try:
         graph = create_minute_writer_graph()
-        state = {"audio_path": audio_file_path}
-        result = graph.invoke(state)
+        state = {"audio_filename": audio_filename, "audio_data": audio_data}
+        result = await graph.ainvoke(state)
         return result["summary"]
     except Exception as e:
         raise RuntimeError(f"Failed to process meeting recording: {str(e)}") from e
@@ -11,14 +11,15 @@
 - Streaming responses for chat functionality
 """
 
+import hashlib
 import tempfile
 from http import HTTPStatus
-from pathlib import Path
 from typing import Annotated
 
 from fastapi import APIRouter, HTTPException, UploadFile
-from fastapi.responses import StreamingResponse
+from sse_starlette.sse import EventSourceResponse
 
+from src.agent import caches
 from src.agent.chatbot import ChatbotAgent
 from src.agent.minute_writer import process_meeting_recording
 
@@ -26,6 +27,38 @@
 
 router = APIRouter()
 
+# Uploads are copied in 1 MiB chunks and kept in memory up to 8 MiB before spilling to disk
+UPLOAD_CHUNK_SIZE = 1 << 20
+UPLOAD_SPOOL_MAX_SIZE = 8 << 20
+
+# Leading bytes inspected to recognise the audio container before copying the rest
+AUDIO_SNIFF_SIZE = 4096
+MPEG_FRAME_SYNC = 0xFFE0
+
+
+def _sniff_audio(head: bytes) -> bool:
+    """
+    Check whether the leading bytes of an upload look like a WAV, MP3 or M4A file.
+
+    Args:
+        head (bytes): The first bytes of the uploaded file.
+
+    Returns:
+        bool: True if a known audio signature is found, False otherwise.
+
+    """
+    is_wav = head.startswith(b"RIFF") and head[8:12] == b"WAVE"
+    # MP3 starts with an ID3v2 tag or directly with an MPEG frame sync (11 set bits)
+    is_mp3 = (
+        head.startswith(b"ID3") or int.from_bytes(head[:2]) & MPEG_FRAME_SYNC == MPEG_FRAME_SYNC
+    )
+    is_m4a = head[4:8] == b"ftyp"
+    return is_wav or is_mp3 or is_m4a
+
+
+# Built once per process so every chat request reuses the same LLM client and graph
+chatbot_agent = ChatbotAgent()
+
 
 @router.post("/minute-writer/process", response_model=AgentResponse)
 async def process_meeting(audio_file: UploadFile) -> AgentResponse:
@@ -48,21 +81,34 @@ async def process_meeting(audio_file: UploadFile) -> AgentResponse:
             detail="Unsupported file format. Please upload MP3, WAV, or M4A files.",
         )
 
-    try:
-        # Create a temporary file to store the uploaded audio
-        with tempfile.NamedTemporaryFile(
-            delete=False, suffix=Path(audio_file.filename).suffix
-        ) as temp_file:
-            # Write uploaded file content to temporary file
-            content = await audio_file.read()
-            temp_file.write(content)
-            temp_file_path = temp_file.name
-
-        # Process the audio file
-        summary = process_meeting_recording(temp_file_path)
+    # Reject mislabelled or non-audio uploads before copying and hashing the whole file
+    head = await audio_file.read(AUDIO_SNIFF_SIZE)
+    if not _sniff_audio(head):
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail="File content is not a valid MP3, WAV, or M4A audio file.",
+        )
 
-        # Clean up the temporary file
-        Path(temp_file_path).unlink()
+    try:
+        # Copy the upload in bounded chunks instead of buffering the whole file at once
+        with tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_SIZE) as buffer:
+            digest = hashlib.sha256(head)
+            buffer.write(head)
+            size = len(head)
+            while chunk := await audio_file.read(UPLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+                buffer.write(chunk)
+                size += len(chunk)
+            buffer.seek(0)
+            # httpx sizes file parts through fileno(), which would roll an in-memory spool
+            # over to disk, so uploads that still fit in memory are handed over as bytes
+            audio = buffer.read() if size <= UPLOAD_SPOOL_MAX_SIZE else buffer
+
+            # Identical uploads skip both transcription and summarization
+            key = digest.hexdigest()
+            if (summary := caches["summary"].get(key)) is None:
+                summary = await process_meeting_recording(audio_file.filename, audio)
+                caches["summary"][key] = summary
 
         return AgentResponse(
             success=True,
@@ -70,7 +116,7 @@ async def process_meeting(audio_file: UploadFile) -> AgentResponse:
             data={"summary": summary},
         )
 
-    except (ValueError, FileNotFoundError) as e:
+    except ValueError as e:
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e)) from e
     except Exception as e:
         raise HTTPException(
@@ -82,12 +128,12 @@ async def process_meeting(audio_file: UploadFile) -> AgentResponse:
 async def chat(
     query: Annotated[dict[str, str], "The message"],
     thread_id: Annotated[str, "Identifier for the chat thread"] = "1",
-) -> StreamingResponse:
+) -> EventSourceResponse:
     """
     Process a chat query and return a response using the ChatbotAgent.
 
     Returns:
-        StreamingResponse: A streaming response containing the chatbot's messages
+        EventSourceResponse: A server-sent event stream containing the chatbot's messages
 
     Raises:
         HTTPException: If an error occurs during processing
@@ -95,11 +141,8 @@ async def chat(
     """
     try:
         config = {"configurable": {"thread_id": thread_id}}
-        agent = ChatbotAgent()
 
-        return StreamingResponse(
-            agent.stream_chatbot(query, config), media_type="text/event-stream"
-        )
+        return EventSourceResponse(chatbot_agent.stream_chatbot(query, config))
 
     except Exception as e:
         raise HTTPException(
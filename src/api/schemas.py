@@ -34,12 +34,12 @@ class MinuteWriterOutput(BaseModel):
     Output model for MinuteWriter class.
 
     Attributes:
-        audio_path (str): Path to the processed audio file
+        audio_filename (str): Name of the processed audio file
         transcript (str): Transcribed text from the audio file
         summary (str): Generated summary of the meeting
 
     """
 
-    audio_path: Annotated[str, "Path to the processed audio file"]
+    audio_filename: Annotated[str, "Name of the processed audio file"]
     transcript: Annotated[str, "Transcribed text from the audio file"]
     summary: Annotated[str, "Generated summary of the meeting"]
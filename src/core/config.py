@@ -26,6 +26,19 @@ class Settings(BaseSettings):
             Defaults to "whisper-v3-large-turbo".
         summary_model (str): The model name for text summarization processing.
             Defaults to "gpt-4o-mini-0125".
+        summary_map_model (str): The model summarizing individual transcript chunks.
+            Defaults to "gpt-4o-mini".
+        summary_reduce_model (str): The model writing the final meeting summary.
+            Defaults to "gpt-4o-mini".
+        response_cache_size (int): Maximum number of entries kept per response cache.
+            Defaults to 1024.
+        response_cache_ttl (int): Seconds before a cached response expires.
+            Defaults to 3600.
+        openai_max_retries (int): Retries with exponential backoff on rate limit and
+            transient server errors. Defaults to 6.
+        openai_requests_per_minute (int): Per-worker OpenAI request budget. Defaults to 500.
+        openai_tokens_per_minute (int): Per-worker OpenAI prompt token budget.
+            Defaults to 200000.
 
     """
 
@@ -34,6 +47,13 @@ class Settings(BaseSettings):
     whisper_model: str = "gpt-4o-mini-transcribe"
     chat_completion_model: str = "gpt-4o-mini"
     coder_model: str = "gpt-4o-mini"
+    summary_map_model: str = "gpt-4o-mini"
+    summary_reduce_model: str = "gpt-4o-mini"
+    response_cache_size: int = 1024
+    response_cache_ttl: int = 3600
+    openai_max_retries: int = 6
+    openai_requests_per_minute: int = 500
+    openai_tokens_per_minute: int = 200_000
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
@@ -18,7 +18,8 @@
 
 Dependencies:
     - streamlit
-    - requests
+    - httpx
+    - sseclient-py
     - fastapi
     - logging
     - typing
@@ -30,9 +31,11 @@
 """
 
 import logging
+import time
 from typing import Any
 
-import requests
+import httpx
+import sseclient
 import streamlit as st
 from fastapi import UploadFile
 from fastapi.openapi.utils import get_openapi
@@ -47,11 +50,35 @@
 AUDIO_EXTENSIONS = (".mp3", ".wav", ".m4a")
 CONTENT_TYPES = {"audio": "audio/mpeg", "default": "application/octet-stream"}
 
+# Connecting should fail fast, but chat streams and transcriptions may take minutes
+HTTP_TIMEOUT = httpx.Timeout(None, connect=5.0)
 
+# Minimum seconds between re-renders of a streaming chat message
+STREAM_FLUSH_INTERVAL = 0.03
+
+
+@st.cache_resource
+def get_http_client() -> httpx.Client:
+    """
+    Return the HTTP client shared by every playground request.
+
+    The client is cached across Streamlit reruns so its keep-alive connections are reused.
+
+    Returns:
+        HTTP/2-capable httpx client
+
+    """
+    return httpx.Client(http2=True, timeout=HTTP_TIMEOUT)
+
+
+@st.cache_data(show_spinner=False)
 def load_routes() -> dict[str, Any]:
     """
     Dynamically load API specifications from main FastAPI app.
 
+    A successful result is cached for the lifetime of the Streamlit server, so the OpenAPI
+    schema is generated once instead of on every script rerun.
+
     Returns:
         dictionary mapping endpoint paths to route configuration dictionaries.
         Each route configuration contains method, input type, description, etc.
@@ -209,68 +236,53 @@ def get_ai_response(prompt: str, chat_container: st.container) -> None:
 
     """
     url = f"{API_BASE_URL}/chat"
+    client = get_http_client()
 
     try:
+        request = client.build_request("POST", url, json={"message": prompt})
         with st.spinner("AI is thinking..."):
-            response = requests.post(url, json={"message": prompt}, stream=True)
-
-        if response.status_code == requests.codes.ok:
-            process_streaming_response(response, chat_container)
-        else:
-            st.error(f"Failed to get response from AI. Status code: {response.status_code}")
-    except requests.exceptions.ConnectionError:
+            response = client.send(request, stream=True)
+
+        try:
+            if response.status_code == httpx.codes.OK:
+                process_streaming_response(response, chat_container)
+            else:
+                st.error(f"Failed to get response from AI. Status code: {response.status_code}")
+        finally:
+            response.close()
+    except httpx.ConnectError:
         st.error(f"Connection error: Could not connect to {url}. Is the API server running?")
     except Exception as e:
         st.error(f"Error: {str(e)}")
 
 
-def parse_sse_line(line: bytes) -> str:
-    """
-    Parse a single SSE line and extract the message content.
-
-    Args:
-        line: Raw bytes from the SSE stream
-
-    Returns:
-        Extracted message content or empty string if line is invalid
-
-    """
-    try:
-        if not line:
-            return "  \n\n"
-
-        decoded_line = line.decode("utf-8")
-        parts = decoded_line.split(": ", 1)
-
-        if len(parts) > 1 and parts[0] == "data":
-            return parts[1]
-        return ""
-    except Exception as e:
-        logging.warning(f"Error parsing SSE line: {str(e)}")
-        return ""
-
-
-def process_streaming_response(response: requests.Response, chat_container: st.container) -> None:
+def process_streaming_response(response: httpx.Response, chat_container: st.container) -> None:
     """
     Process streaming response from AI API.
 
     Args:
-        response: Streaming response from requests
+        response: Streaming response from httpx
         chat_container: Streamlit container for displaying chat messages
 
     """
     with chat_container:
         with st.chat_message("assistant"):
             message_placeholder = st.empty()
-            ai_message = ""
+            parts: list[str] = []
+            last_flush = time.monotonic()
 
             try:
-                for i, line in enumerate(response.iter_lines()):
-                    if i % 2 == 0:  # Process every other line as per SSE format
-                        message_content = parse_sse_line(line)
-                        if message_content:
-                            ai_message += message_content
-                            message_placeholder.markdown(ai_message)
+                client = sseclient.SSEClient(response.iter_bytes())
+                for event in client.events():
+                    parts.append(event.data)
+
+                    # Re-rendering markdown is costly, so refresh at most every flush interval
+                    if time.monotonic() - last_flush > STREAM_FLUSH_INTERVAL:
+                        message_placeholder.markdown("".join(parts))
+                        last_flush = time.monotonic()
+
+                ai_message = "".join(parts)
+                message_placeholder.markdown(ai_message)
 
                 # Add complete message to chat history
                 if ai_message:
@@ -303,6 +315,9 @@ def render_file_upload(route_info: dict[str, Any]) -> UploadFile:
 
 # Initialize routes at module level
 REGISTERED_ROUTES = load_routes()
+if not REGISTERED_ROUTES:
+    # Don't keep a failed load cached, so the next rerun tries again
+    load_routes.clear()
 
 
 def main() -> None:
@@ -374,7 +389,7 @@ def handle_api_request(route_info: dict[str, Any], files: UploadFile | None) ->
 
         display_response(response)
 
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         st.error(f"Error making request: {str(e)}")
     except Exception as e:
         st.error(f"Unexpected error: {str(e)}")
@@ -383,13 +398,14 @@ def handle_api_request(route_info: dict[str, Any], files: UploadFile | None) ->
             files.file.close()
 
 
-def make_api_request(url: str, method: str, files: UploadFile | None) -> requests.Response:
+def make_api_request(url: str, method: str, files: UploadFile | None) -> httpx.Response:
     """Handle API requests with proper error handling."""
+    client = get_http_client()
     if method == "GET":
-        return requests.get(url)
+        return client.get(url)
     elif method == "POST":
         files_dict = prepare_files_dict(files) if files else None
-        return requests.post(url, files=files_dict)
+        return client.post(url, files=files_dict)
     else:
         raise ValueError(f"Unsupported method: {method}")
 
@@ -400,7 +416,7 @@ def prepare_files_dict(files: UploadFile) -> dict[str, tuple]:
     return {"audio_file": (files.filename, files.file.read(), get_content_type(files.filename))}
 
 
-def display_response(response: requests.Response) -> None:
+def display_response(response: httpx.Response) -> None:
     """Display API response with proper formatting."""
     st.subheader("Response")
     st.write(f"Status Code: {response.status_code}")
@@ -0,0 +1,20 @@
+"""
+Gunicorn worker class for serving the FastAPI application with uvicorn.
+
+The worker extends uvicorn's UvicornWorker with a per-process concurrency cap read from the
+LIMIT_CONCURRENCY environment variable. Once the cap is reached uvicorn answers new requests
+with HTTP 503 instead of queueing them behind in-flight LLM calls.
+"""
+
+import os
+
+from uvicorn.workers import UvicornWorker
+
+
+class LimitedUvicornWorker(UvicornWorker):
+    """UvicornWorker that honours the LIMIT_CONCURRENCY environment variable."""
+
+    CONFIG_KWARGS = {
+        **UvicornWorker.CONFIG_KWARGS,
+        "limit_concurrency": int(os.getenv("LIMIT_CONCURRENCY", "0")) or None,
+    }
@@ -9,11 +9,47 @@
 the Anthropic SDK for AI capabilities.
 """
 
+import logging
+import threading
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import httpx
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
+from src.agent import http_client, load_tokenizer
 from src.api.endpoints import router
+from src.core.config import settings
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """
+    Pre-warm the shared OpenAI connection pool and start loading the tokenizer on startup.
+
+    The tokenizer loads in a daemon thread of each worker, after gunicorn has forked, so a
+    slow BPE download neither delays startup nor leaves a forked worker waiting on a lock
+    held by a thread that only exists in the master.
+
+    The client belongs to ``src.agent`` and is left open on shutdown, so closing the app
+    never takes the pool away from other users of the same process.
+
+    Yields:
+        None: Control back to FastAPI while the application is serving requests.
+
+    """
+    threading.Thread(target=load_tokenizer, daemon=True).start()
+
+    try:
+        await http_client.head(settings.openai_base_url)
+    except httpx.HTTPError as e:
+        logging.warning(f"Failed to pre-warm OpenAI connection pool: {str(e)}")
+
+    yield
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Include API routes
 app.include_router(router)
@@ -0,0 +1,55 @@
+"""Shared fixtures for the test suite."""
+
+import os
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+from dotenv import dotenv_values
+from sse_starlette.sse import AppStatus
+
+# Settings requires the OpenAI endpoint and key, so without them the app cannot even be
+# imported. Blank placeholders let the suite collect; tests needing a model skip on them.
+for name in ("OPENAI_BASE_URL", "OPENAI_API_KEY"):
+    if os.getenv(name) is None and name not in dotenv_values(".env"):
+        os.environ[name] = ""
+
+from src.agent.chatbot import ChatbotAgent  # noqa: E402
+from src.agent.minute_writer import MinuteWriter  # noqa: E402
+from src.main import app  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    """Run async tests on asyncio, sharing one event loop across the whole session."""
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def client() -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Fixture to create an async client that runs the app lifespan once per session.
+
+    The lifespan and every request run on the test event loop, so the shared OpenAI
+    connection pool and sse-starlette's exit event are only ever bound to that one loop.
+    """
+    # sse-starlette creates this event on first use and binds it to whichever loop that was
+    AppStatus.should_exit_event = None
+    transport = httpx.ASGITransport(app=app)
+    async with (
+        app.router.lifespan_context(app),
+        httpx.AsyncClient(transport=transport, base_url="http://test") as test_client,
+    ):
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def chatbot() -> ChatbotAgent:
+    """Fixture to create a ChatBot instance for testing."""
+    return ChatbotAgent()
+
+
+@pytest.fixture(scope="session")
+def minute_writer() -> MinuteWriter:
+    """Fixture to create a MinuteWriter instance for testing."""
+    return MinuteWriter()
@@ -1,47 +1,90 @@
 """Test cases for the API endpoints."""
 
+import io
 from http import HTTPStatus
 from pathlib import Path
 
+import httpx
+import orjson
 import pytest
-from fastapi.testclient import TestClient
 
-from src.main import app
+from src.api.endpoints import _sniff_audio
+from src.core.config import settings
 
+# Read through settings so a key supplied via .env counts as configured; conftest leaves
+# both values blank when neither the environment nor .env provides them
+requires_llm = pytest.mark.skipif(
+    not (settings.openai_base_url and settings.openai_api_key), reason="LLM key required"
+)
 
-@pytest.fixture
-def client() -> TestClient:
-    """Fixture to create a test client."""
-    return TestClient(app)
+pytestmark = pytest.mark.anyio
 
 
-def test_health_check(client: TestClient) -> None:
+@pytest.fixture(scope="session")
+def test_wav_bytes() -> bytes:
+    """Fixture to read the test.wav audio file once per test session."""
+    return (Path(__file__).parent / "test.wav").read_bytes()
+
+
+def audio_files(audio: bytes) -> dict[str, tuple[str, io.BytesIO, str]]:
+    """Wrap shared audio bytes in a fresh stream for a multipart upload."""
+    return {"audio_file": ("test.wav", io.BytesIO(audio), "audio/wav")}
+
+
+@pytest.mark.parametrize(
+    ("head", "expected"),
+    [
+        (b"RIFF\x24\x08\x00\x00WAVEfmt ", True),
+        (b"ID3\x04\x00\x00\x00\x00\x00\x00", True),
+        (b"\xff\xfb\x90\x64\x00", True),
+        (b"\x00\x00\x00\x20ftypM4A \x00\x00\x00\x00", True),
+        (b"", False),
+        (b"\xff\xd8\xff\xe0\x00\x10JFIF", False),
+        (b"not an audio file", False),
+    ],
+    ids=["wav", "mp3-id3", "mp3-frame-sync", "m4a", "empty", "jpeg", "text"],
+)
+def test_sniff_audio(head: bytes, expected: bool) -> None:
+    """Test that audio signatures are recognised and other content is not."""
+    assert _sniff_audio(head) is expected
+
+
+async def test_health_check(client: httpx.AsyncClient) -> None:
     """Test the health check endpoint."""
-    response = client.get("/")
+    response = await client.get("/")
     assert response.status_code == HTTPStatus.OK
     assert response.json() == {"message": "Welcome to the FastAPI LangGraph Agent!"}
 
 
-def test_chat_endpoint(client: TestClient) -> None:
+@requires_llm
+@pytest.mark.parametrize("message", ["Hello", "Hi", "Ping"])
+async def test_chat_endpoint(client: httpx.AsyncClient, message: str) -> None:
     """Test the chat endpoint."""
-    test_message = {"message": "Hello"}
-    response = client.post("/chat", json=test_message)
-    assert response.status_code == HTTPStatus.OK
-    assert response.headers["content-type"] == "text/event-stream; charset=utf-8"
-    content = b"".join(response.iter_bytes()).decode()
-    assert content
+    test_message = {"message": message}
+    async with client.stream("POST", "/chat", json=test_message) as response:
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["content-type"] == "text/event-stream; charset=utf-8"
+        # Only the arrival of an event matters, so stop at the first non-empty chunk
+        first = b""
+        async for chunk in response.aiter_bytes():
+            if chunk:
+                first = chunk
+                break
+        assert first
 
 
-def test_minute_endpoint(client: TestClient) -> None:
+@requires_llm
+@pytest.mark.integration
+async def test_minute_endpoint(client: httpx.AsyncClient, test_wav_bytes: bytes) -> None:
     """Test the minute writing endpoint with audio file upload."""
-    # Use the existing test.wav file in the tests directory
-    with Path("tests/test.wav").open("rb") as audio_file:
-        test_audio_content = audio_file.read()
+    response = await client.post("/minute-writer/process", files=audio_files(test_wav_bytes))
+    assert response.status_code == HTTPStatus.OK
+    body = orjson.loads(response.content)
+    assert body["success"]
+    assert "summary" in body["data"]
 
-    # Create test file data with correct MIME type
-    files = {"audio_file": ("test.wav", test_audio_content, "audio/wav")}
 
-    response = client.post("/minute-writer/process", files=files)
-    assert response.status_code == HTTPStatus.OK
-    assert response.json()["success"]
-    assert "summary" in response.json()["data"]
+async def test_minute_endpoint_rejects_non_audio(client: httpx.AsyncClient) -> None:
+    """Test that uploads without an audio signature are rejected before processing."""
+    response = await client.post("/minute-writer/process", files=audio_files(b"not an audio file"))
+    assert response.status_code == HTTPStatus.BAD_REQUEST
@@ -2,21 +2,40 @@
 
 import pytest
 
-from src.agent.minute_writer import MinuteWriter
+from src.agent import CHARS_PER_TOKEN
+from src.agent.minute_writer import MinuteWriter, _split_transcript
 
+TRANSCRIPT = "Alice: budget approved. Bob: ship on Friday. Carol: next sync Monday."
 
-@pytest.fixture
-def minute_writer() -> MinuteWriter:
-    """Fixture to create a MinuteWriter instance for testing."""
-    return MinuteWriter()
 
+class CharTokenizer:
+    """Stand-in tokenizer with one token per character, so chunk bounds are predictable."""
 
-def test_minute_writer_initialization(minute_writer: MinuteWriter) -> None:
-    """Test if MinuteWriter is initialized correctly."""
-    assert isinstance(minute_writer, MinuteWriter)
+    def encode(self, text: str) -> list[int]:
+        """Encode text as a list of code points."""
+        return [ord(char) for char in text]
 
+    def decode(self, tokens: list[int]) -> str:
+        """Decode a list of code points back into text."""
+        return "".join(chr(token) for token in tokens)
 
-def test_minute_writer_attributes(minute_writer: MinuteWriter) -> None:
-    """Test if MinuteWriter has the required attributes."""
+
+def test_minute_writer_initialization(minute_writer: MinuteWriter) -> None:
+    """Test if MinuteWriter is initialized correctly with the required attributes."""
+    assert isinstance(minute_writer, MinuteWriter)
     assert hasattr(minute_writer, "whisper")
     assert hasattr(minute_writer, "summarizer")
+
+
+@pytest.mark.parametrize(
+    ("tokenizer", "chunk_size"), [(CharTokenizer(), 10), (None, 10 * CHARS_PER_TOKEN)]
+)
+def test_split_transcript(
+    monkeypatch: pytest.MonkeyPatch, tokenizer: CharTokenizer | None, chunk_size: int
+) -> None:
+    """Test that transcripts split in order by tokens, or by estimate without a tokenizer."""
+    monkeypatch.setattr("src.agent.minute_writer.get_tokenizer", lambda: tokenizer)
+    chunks = _split_transcript(TRANSCRIPT, max_tokens=10)
+    assert len(chunks) == -(-len(TRANSCRIPT) // chunk_size)
+    assert all(len(chunk) <= chunk_size for chunk in chunks)
+    assert "".join(chunks) == TRANSCRIPT